@@ -1,11 +1,50 @@
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+import httpx
+import lxml.etree
+import lxml.html
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import argparse
+import calendar
+import codecs
+import logging
+import shelve
 import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_ANCHOR_XPATH = lxml.etree.XPath("//a[@href]")
+_ARTICLE_RE = re.compile(r"/\d{4}/\d{2}/\d{2}/")
+_SKIP_URLS_RE = re.compile(r"/(?:videos|gallery)/")
+_SKIP_TITLES_RE = re.compile(r"Video|Gallery")
+# Retry failed connections and transient gateway errors with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+# Whitespace runs match \s+ as they do in strptime, since the timestamp markup
+# puts a newline and indentation after "Updated"
+_DATE_RE = re.compile(
+    r"Updated\s+(\d{1,2}):(\d{2})\s+(AM|PM)\s+([A-Z]+),\s+(\w{3})\s+(\w+)\s+(\d{1,2}),\s+(\d{4})"
+)
+_WEEKDAYS = frozenset({"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"})
+_MONTHS = {
+    "January": 1, "February": 2, "March": 3, "April": 4, "May": 5, "June": 6,
+    "July": 7, "August": 8, "September": 9, "October": 10, "November": 11, "December": 12,
+}
+
+def positive_int(value):
+    """Argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return number
 
 def create_parser():
     """Create and return the argument parser."""
@@ -15,16 +54,16 @@ def create_parser():
 ║                         CNN News Scraper CLI                           ║
 ║                                                                       ║
 ║  A powerful tool for scraping and analyzing CNN news articles.        ║
-║  Supports multithreading, custom user agents, and flexible output.    ║
+║  Supports async fetching, custom user agents, and flexible output.    ║
 ╚═══════════════════════════════════════════════════════════════════════╝
     """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument('-t', '--threads', 
-                       type=int, 
+                       type=positive_int, 
                        default=10,
-                       help='Number of threads to use (default: 10)')
+                       help='Number of concurrent article requests (default: 10)')
     
     parser.add_argument('-u', '--user-agent',
                        type=str,
@@ -46,55 +85,159 @@ def create_parser():
                        type=str,
                        help='Output file name (for JSON output)')
     
+    parser.add_argument('-v', '--verbose',
+                       action='store_true',
+                       help='Log per-article fetch and parse timings')
+    
+    parser.add_argument('--cache',
+                       type=str,
+                       help='Cache file for conditional (ETag/Last-Modified) requests across runs')
+    
     return parser
 
 class CNNNewsScraper:
-    def __init__(self, base_url="https://www.cnn.com", threads=10, user_agent=None):
+    def __init__(self, base_url="https://www.cnn.com", threads=10, user_agent=None, verbose=False,
+                 cache_path=None):
         """
-        Initializes the CNNNewsScraper with a base URL and a requests session.
+        Initializes the CNNNewsScraper with a base URL and an HTTP/2 client.
 
         Args:
             base_url (str): The base URL of the CNN website. Defaults to "https://www.cnn.com".
-            threads (int): Number of threads to use for scraping. Defaults to 10.
+            threads (int): Maximum number of concurrent article requests. Defaults to 10.
             user_agent (str): Custom user agent string. Defaults to None.
+            verbose (bool): Collect per-article fetch and parse timings. Defaults to False.
+            cache_path (str): Path of a shelve file used to send conditional requests and
+                reuse results for unchanged pages. Defaults to None (no caching).
+
+        Raises:
+            ValueError: If threads is less than 1.
         """
+        if threads < 1:
+            raise ValueError(f"threads must be at least 1, got {threads}")
         self.base_url = base_url
         self.threads = threads
-        self.session = requests.Session()
-        
+        self.verbose = verbose
+        self.timings = []
+        self.cache = shelve.open(cache_path) if cache_path else None
+
         default_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.61 Safari/537.36"
-        self.session.headers.update({
-            "User-Agent": user_agent or default_user_agent
-        })
+        # Size the pool to the worker count so every worker can keep a warm
+        # connection. No custom transport, so proxy environment variables apply
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=threads, max_keepalive_connections=threads),
+            headers={
+                "User-Agent": user_agent or default_user_agent,
+                "Accept-Encoding": "br, gzip",
+            },
+            timeout=10.0,
+            follow_redirects=True,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying HTTP client and its pooled connections.
+        """
+        await self.client.aclose()
+        if self.cache is not None:
+            self.cache.close()
 
-    def fetch_main_page(self):
+    async def _conditional_get(self, url):
+        """
+        Sends a GET request, revalidating any cached copy of the URL and retrying
+        failed connections and 502/503/504 responses with exponential backoff.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            tuple: The response and the cached result if the server answered
+                304 Not Modified, otherwise the response and None.
+
+        Raises:
+            httpx.HTTPError: If there is an issue with the network request.
+        """
+        entry = self.cache.get(url) if self.cache is not None else None
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                response = await self.client.get(url, headers=headers)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt == _MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+            await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+
+        if entry and response.status_code == httpx.codes.NOT_MODIFIED:
+            return response, entry["result"]
+        response.raise_for_status()
+        return response, None
+
+    def _store_cached(self, url, response, result):
+        """
+        Caches a result under its URL if the response carries validators.
+        """
+        if self.cache is None:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "result": result,
+            }
+
+    async def fetch_main_page(self):
         """
         Fetches the HTML content of the CNN main page.
 
         Returns:
-            str: The HTML content of the main page if successful, None otherwise.
+            tuple: The raw HTML content of the main page (bytes) and the encoding to
+                decode it with (str) if successful, None otherwise.
 
         Raises:
-            requests.RequestException: If there is an issue with the network request.
+            httpx.HTTPError: If there is an issue with the network request.
         """
         try:
             start_time = time.time()
-            print("Fetching main page...")
-            response = self.session.get(self.base_url, timeout=10)
-            response.raise_for_status()
+            logger.info("Fetching main page...")
+            response, cached = await self._conditional_get(self.base_url)
             fetch_time = time.time() - start_time
-            print(f"Collected main page. Fetch time: {fetch_time:.2f} seconds")
-            return response.text
-        except requests.RequestException as e:
-            print(f"Error fetching CNN main page: {e}")
+            if cached is not None:
+                logger.info("Main page not modified. Fetch time: %.2f seconds", fetch_time)
+                return cached
+            logger.info("Collected main page. Fetch time: %.2f seconds", fetch_time)
+            # response.encoding is the Content-Type charset, or UTF-8 when none is declared
+            main_page = (response.content, response.encoding)
+            self._store_cached(self.base_url, response, main_page)
+            return main_page
+        except httpx.HTTPError as e:
+            logger.error("Error fetching CNN main page: %s", e)
             return None
 
-    def parse_main_page(self, html_content):
+    def parse_main_page(self, html_content, encoding=None):
         """
         Parses the main page HTML to extract article links and titles.
 
         Args:
-            html_content (str): The HTML content of the main page.
+            html_content (bytes): The raw HTML content of the main page.
+            encoding (str): The charset to decode the page with. Defaults to None,
+                which leaves detection to the page's meta charset.
 
         Returns:
             list: A list of dictionaries containing article titles and URLs.
@@ -103,34 +246,44 @@ class CNNNewsScraper:
             None
         """
         parse_start = time.time()
-        soup = BeautifulSoup(html_content, "html.parser")
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            parser = lxml.html.HTMLParser()
+        try:
+            tree = lxml.html.fromstring(html_content, parser=parser)
+        except lxml.etree.ParserError as e:
+            logger.warning("Could not parse main page: %s", e)
+            return []
         articles = []
+        seen = set()
 
-        print("Parsing main page for articles...")
-        article_pattern = re.compile(r"/\d{4}/\d{2}/\d{2}/")
+        logger.info("Parsing main page for articles...")
 
-        for link in soup.find_all("a", href=True):
+        for link in _ANCHOR_XPATH(tree):
             article_url = link.get("href")
-            title = link.get_text(strip=True)
 
-            if "Video" in title or "Gallery" in title:
+            # Filter on the URL first so title text is only extracted for candidates
+            if not _ARTICLE_RE.search(article_url) or _SKIP_URLS_RE.search(article_url):
                 continue
 
-            if article_url and article_pattern.search(article_url):
-                if article_url.startswith("/"):
-                    article_url = f"{self.base_url}{article_url}"
+            title = " ".join(link.text_content().split())
+            if not title or _SKIP_TITLES_RE.search(title):
+                continue
 
-                if title:
-                    articles.append({"title": title, "url": article_url})
+            if article_url.startswith("/"):
+                article_url = f"{self.base_url}{article_url}"
 
-        unique_articles = {article["url"]: article for article in articles}.values()
+            if article_url not in seen:
+                seen.add(article_url)
+                articles.append({"title": title, "url": article_url})
 
         parse_time = time.time() - parse_start
-        print(f"Parse time for main page: {parse_time:.2f} seconds")
-        print(f"Found {len(unique_articles)} unique articles on the main page.")
-        return list(unique_articles)
+        logger.info("Parse time for main page: %.2f seconds", parse_time)
+        logger.info("Found %d unique articles on the main page.", len(articles))
+        return articles
 
-    def fetch_article(self, article_info):
+    async def fetch_article(self, article_info):
         """
         Fetches and parses a single article page to extract its content.
 
@@ -141,58 +294,66 @@ class CNNNewsScraper:
             dict: A dictionary containing the article's title, date, content, and URL.
 
         Raises:
-            requests.RequestException: If there is an issue with the network request.
+            httpx.HTTPError: If there is an issue with the network request.
         """
         url = article_info["url"]
         try:
-            fetch_start = time.time()
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            fetch_time = time.time() - fetch_start
-            print(
-                f"Fetched article: {article_info['title']} in {fetch_time:.2f} seconds"
-            )
-
-            parse_start = time.time()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            title_tag = soup.find("h1")
-            title = title_tag.text.strip() if title_tag else article_info["title"]
-
-            date_tag = soup.find("div", class_="timestamp vossi-timestamp")
-            date_str = date_tag.text.strip() if date_tag else None
-            try:
-                date = (
-                    datetime.strptime(
-                        date_str, "Updated %I:%M %p %Z, %a %B %d, %Y"
-                    ).strftime("%Y-%m-%d %H:%M:%S")
-                    if date_str
-                    else "No Date Found"
+            fetch_start = time.time() if self.verbose else None
+            response, cached = await self._conditional_get(url)
+            if cached is not None:
+                return cached
+
+            parse_start = time.time() if self.verbose else None
+            # Lexbor reads raw bytes as UTF-8, so only decode in Python when the
+            # Content-Type header declares some other charset
+            if codecs.lookup(response.encoding).name == "utf-8":
+                tree = LexborHTMLParser(response.content)
+            else:
+                tree = LexborHTMLParser(response.text)
+
+            title_tag = tree.css_first("h1")
+            title = title_tag.text().strip() if title_tag else article_info["title"]
+
+            date_tag = tree.css_first("div.timestamp.vossi-timestamp")
+            date_str = date_tag.text().strip() if date_tag else None
+            date = "No Date Found"
+            match = _DATE_RE.fullmatch(date_str) if date_str else None
+            if match:
+                hour, minute, ampm, _, weekday, month_name, day, year = match.groups()
+                month = _MONTHS.get(month_name)
+                if (
+                    month
+                    and weekday in _WEEKDAYS
+                    and 1 <= int(hour) <= 12
+                    and int(minute) < 60
+                    and 1 <= int(day) <= calendar.monthrange(int(year), month)[1]
+                ):
+                    hour24 = int(hour) % 12 + (12 if ampm == "PM" else 0)
+                    date = f"{year}-{month:02d}-{int(day):02d} {hour24:02d}:{minute}:00"
+
+            paragraphs = tree.css("div.paragraph__content") or tree.css("p")
+            parts = [
+                text
+                for p in paragraphs
+                if (text := p.text(strip=True)) and text != "Follow:"
+            ]
+            content = "\n".join(parts) or "No Content Found"
+
+            if self.verbose:
+                self.timings.append(
+                    (url, parse_start - fetch_start, time.time() - parse_start)
                 )
-            except (ValueError, TypeError):
-                date = "No Date Found"
-
-            paragraphs = soup.find_all(
-                "div", class_="paragraph__content"
-            ) or soup.find_all("p")
-            content = (
-                "\n".join(p.get_text(strip=True) for p in paragraphs)
-                if paragraphs
-                else "No Content Found"
-            )
-            content = content.replace("Follow:", "").strip()
-
-            parse_time = time.time() - parse_start
-            print(f"Parsed article: {title} in {parse_time:.2f} seconds")
-
-            return {"title": title, "date": date, "content": content, "url": url}
-        except requests.RequestException as e:
-            print(f"Error fetching article: {e}")
+
+            article = {"title": title, "date": date, "content": content, "url": url}
+            self._store_cached(url, response, article)
+            return article
+        except httpx.HTTPError as e:
+            logger.error("Error fetching article %s: %s", url, e)
             return None
 
-    def get_main_page_articles(self):
+    async def get_main_page_articles(self):
         """
-        Scrapes articles from the CNN main page using multithreading.
+        Scrapes articles from the CNN main page using concurrent async requests.
 
         Returns:
             list: A list of dictionaries containing the scraped articles' details.
@@ -200,41 +361,99 @@ class CNNNewsScraper:
         Raises:
             None
         """
-        html_content = self.fetch_main_page()
-        if html_content:
-            articles = self.parse_main_page(html_content)
+        main_page = await self.fetch_main_page()
+        if main_page:
+            html_content, encoding = main_page
+            articles = self.parse_main_page(html_content, encoding)
             if articles:
-                print(f"Starting threaded download of {len(articles)} articles...")
-
-                results = []
-                with ThreadPoolExecutor(max_workers=self.threads) as executor:
-                    future_to_article = {
-                        executor.submit(self.fetch_article, article): article
-                        for article in articles
-                    }
-                    for future in as_completed(future_to_article):
-                        result = future.result()
-                        if result:
-                            results.append(result)
-
-                print(f"Successfully retrieved {len(results)} articles.")
+                logger.info("Starting concurrent download of %d articles...", len(articles))
+
+                self.timings = []
+                # A fixed set of workers pulls from one shared iterator and writes
+                # into a preallocated list, keeping main page order without
+                # creating a task per article
+                results = [None] * len(articles)
+                pending = iter(enumerate(articles))
+
+                async def worker():
+                    for index, article in pending:
+                        try:
+                            results[index] = await self.fetch_article(article)
+                        except Exception as e:
+                            logger.error("Error processing article: %s", e)
+
+                await asyncio.gather(
+                    *(worker() for _ in range(min(self.threads, len(articles))))
+                )
+                results = [result for result in results if result]
+
+                if self.verbose:
+                    self._log_timings()
+                logger.info("Successfully retrieved %d articles.", len(results))
                 return results
             else:
-                print("No articles were found on the main page.")
+                logger.warning("No articles were found on the main page.")
                 return []
         else:
-            print("Failed to retrieve main page articles.")
+            logger.error("Failed to retrieve main page articles.")
             return []
 
+    def _log_timings(self):
+        """
+        Logs the per-article timings collected by fetch_article as a single summary.
+        """
+        if not self.timings:
+            return
+        for url, fetch_time, parse_time in self.timings:
+            logger.debug("%s: fetch %.2fs, parse %.2fs", url, fetch_time, parse_time)
+        fetch_times = [fetch_time for _, fetch_time, _ in self.timings]
+        parse_times = [parse_time for _, _, parse_time in self.timings]
+        logger.info(
+            "Timed %d articles. Fetch avg %.2fs / max %.2fs, parse avg %.2fs / max %.2fs",
+            len(self.timings),
+            sum(fetch_times) / len(fetch_times),
+            max(fetch_times),
+            sum(parse_times) / len(parse_times),
+            max(parse_times),
+        )
+
+async def scrape(threads=10, user_agent=None, verbose=False, cache_path=None):
+    """
+    Runs a full scrape of the CNN main page and closes the client afterwards.
+
+    Args:
+        threads (int): Maximum number of concurrent article requests. Defaults to 10.
+        user_agent (str): Custom user agent string. Defaults to None.
+        verbose (bool): Collect and log per-article timings. Defaults to False.
+        cache_path (str): Path of a conditional request cache file. Defaults to None.
+
+    Returns:
+        list: A list of dictionaries containing the scraped articles' details.
+    """
+    async with CNNNewsScraper(
+        threads=threads, user_agent=user_agent, verbose=verbose, cache_path=cache_path
+    ) as scraper:
+        return await scraper.get_main_page_articles()
+
 def main():
     parser = create_parser()
     args = parser.parse_args()
 
-    # Initialize scraper with CLI arguments
-    scraper = CNNNewsScraper(threads=args.threads, user_agent=args.user_agent)
-    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    # Run the async scraper with CLI arguments
     total_start = time.time()
-    articles = scraper.get_main_page_articles()
+    articles = asyncio.run(
+        scrape(
+            threads=args.threads,
+            user_agent=args.user_agent,
+            verbose=args.verbose,
+            cache_path=args.cache,
+        )
+    )
     total_time = time.time() - total_start
     
     print(f"Total scraping time: {total_time:.2f} seconds")
@@ -254,10 +473,8 @@ def main():
             print(f"Content: {content}")
             print(f"URL: {article['url']}\n")
     else:  # json output
-        import json
         output_file = args.file or 'cnn_articles.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=4)
+        Path(output_file).write_bytes(orjson.dumps(articles, option=orjson.OPT_INDENT_2))
         print(f"Articles saved to {output_file}")
 
 if __name__ == "__main__":
@@ -9,24 +9,29 @@ setup(
     url='https://github.com/cory-kujawski-engineer/cnn_scraper',
     packages=find_packages(),
     install_requires=[
-        'beautifulsoup4==4.12.3',
+        'anyio==4.5.2',
+        'brotli==1.1.0; platform_python_implementation == "CPython"',
         'certifi==2024.8.30',
-        'charset-normalizer==3.4.0',
-        'html5lib==1.1',
+        'exceptiongroup==1.2.2; python_version < "3.11"',
+        'h11==0.14.0',
+        'h2==4.1.0',
+        'hpack==4.0.0',
+        'httpcore==1.0.6',
+        'httpx[http2,brotli]==0.27.2',
+        'hyperframe==6.0.1',
         'idna==3.10',
         'lxml==5.3.0',
-        'requests==2.32.3',
-        'six==1.16.0',
-        'soupsieve==2.6',
-        'urllib3==2.2.3',
-        'webencodings==0.5.1'
+        'orjson==3.10.7',
+        'selectolax==0.3.21',
+        'sniffio==1.3.1',
+        'typing_extensions==4.12.2; python_version < "3.11"'
     ],
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
     entry_points={
         'console_scripts': [
             'cnn_scraper=cnn_scraper:main',  # Assuming you have a main function to run